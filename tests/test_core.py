@@ -22,8 +22,6 @@ import unittest
 
 from typing import Optional
 
-from webpage.core import HTML, LaTeX, TimeSpan, Conference, Contribution
-
 
 class TestLaTeX(unittest.TestCase):
 
@@ -33,6 +31,7 @@ class TestLaTeX(unittest.TestCase):
     def test_base(self, text:str = 'Hello world!'):
         """Basic tests of the LateX commands.
         """
+        from webpage.core import LaTeX
         source = LaTeX.emph(text)
         target = '\\emph{{{}}}'.format(text)
         self.assertEqual(source, target)
@@ -55,6 +54,7 @@ class TestHTML(unittest.TestCase):
     def test_base(self, text:str = 'Hello world!'):
         """Basic tests of the HTML tags.
         """
+        from webpage.core import HTML
         source = HTML.emph(text)
         target = '<em>{}</em>'.format(text)
         self.assertEqual(source, target)
@@ -65,6 +65,36 @@ class TestHTML(unittest.TestCase):
         target = '<tt>{}</tt>'.format(text)
         self.assertEqual(source, target)
 
+    def test_attributes(self, text:str = 'Hello world!'):
+        """Test the formatting of tags with multiple attributes.
+        """
+        from webpage.core import HTML
+        source = HTML.tag(text, 'a', class_='active', href='index.html')
+        target = '<a href="index.html" class="active">{}</a>'.format(text)
+        self.assertEqual(source, target)
+        source = HTML.tag_open('li', 1, class_='active')
+        self.assertEqual(source, '  <li class="active">')
+
+    def test_escape(self):
+        """Test the escaping of the special characters.
+        """
+        from webpage.core import HTML, LaTeX
+        self.assertEqual(HTML.escape('A & "B" <C>'), 'A &amp; &quot;B&quot; &lt;C&gt;')
+        self.assertEqual(LaTeX.escape('100% A_B & $C #1'), '100\\% A\\_B \\& \\$C \\#1')
+
+    def test_indent(self):
+        """Test the indentation at ordinary, very deep and negative levels.
+        """
+        from webpage.core import HTML
+        text = 'a\nb'
+        for level in (-1, 0, 1, 4, 40):
+            prefix = HTML.INDENT_STRING * level
+            target = f'{prefix}a\n{prefix}b'
+            self.assertEqual(HTML.indent(text, level), target)
+            self.assertEqual(HTML.indent('a', level), f'{prefix}a')
+            self.assertEqual(HTML.indent_string(level), prefix)
+        self.assertEqual(HTML.indent(text, -1), text)
+
 
 
 class TestTimeSpan(unittest.TestCase):
@@ -76,6 +106,7 @@ class TestTimeSpan(unittest.TestCase):
               single_day: bool = False):
         """Basic test worker.
         """
+        from webpage.core import TimeSpan
         span = TimeSpan(begin, end)
         print(span)
         print(span.html())
@@ -97,6 +128,24 @@ class TestTimeSpan(unittest.TestCase):
         """
         self._test('1977-04-05', single_day=True)
 
+    def test_backward(self):
+        """Test that swapped bounds are rejected.
+        """
+        from webpage.core import TimeSpan
+        with self.assertRaises(ValueError):
+            TimeSpan('2019-05-10', '1977-04-05')
+
+    def test_format(self):
+        """Test the exact output format in all the relevant cases.
+        """
+        from webpage.core import TimeSpan
+        self.assertEqual(TimeSpan('1977-04-05').ascii(), '05 April, 1977')
+        self.assertEqual(TimeSpan('2019-04-02', '2019-04-08').ascii(), '02--08 April, 2019')
+        self.assertEqual(TimeSpan('2019-04-28', '2019-05-03').html(),
+                         '28 April&ndash;03 May, 2019')
+        self.assertEqual(TimeSpan('2018-12-30', '2019-01-02').latex(),
+                         '30 December, 2018--02 January, 2019')
+
 
 
 class TestContribution(unittest.TestCase):
@@ -108,6 +157,7 @@ class TestContribution(unittest.TestCase):
               notes: Optional[str] = None):
         """Basic test worker.
         """
+        from webpage.core import Contribution
         contribution = Contribution(title, invited, poster, notes)
         print(contribution)
         print(contribution.html())
@@ -133,6 +183,25 @@ class TestContribution(unittest.TestCase):
         """
         self._test('Lecture', invited=True, notes='Series of invited lectures')
 
+    def test_flags(self):
+        """Make sure the invited and poster flags accept any truthy or falsy value.
+        """
+        from webpage.core import Contribution
+        for invited, poster in (('yes', None), (None, 1), (0, ''), (2, 'no')):
+            source = Contribution('Title', invited, poster)
+            target = Contribution('Title', bool(invited), bool(poster))
+            self.assertEqual(source.ascii(), target.ascii())
+            self.assertEqual(source.html(), target.html())
+            self.assertEqual(source.latex(), target.latex())
+
+    def test_escape(self):
+        """Make sure the titles and notes are escaped in the html output.
+        """
+        from webpage.core import Contribution
+        contribution = Contribution('A & "B"', notes='<C>')
+        self.assertEqual(contribution.html(),
+                         '<em>"A &amp; &quot;B&quot;"</em> (<b>&lt;C&gt;</b>)')
+
 
 
 class TestConference(unittest.TestCase):
@@ -143,12 +212,56 @@ class TestConference(unittest.TestCase):
     def test_basic(self):
         """Test the plain constructor.
         """
+        from webpage.core import Conference
         conference = Conference('A conference', 'San Diego', 'www.conference.us',
                                 '2012-04-16', '2012-04-17', )
+        self.assertEqual(conference.year(), 2012)
         print(conference)
         print(conference.html())
         print(conference.latex())
 
+    def test_contributions(self):
+        """Make sure all the representations reflect the contribution list,
+        including items added to it directly.
+        """
+        from webpage.core import Conference, Contribution
+        conference = Conference('A conference', 'San Diego', None, '2012-04-16')
+        conference.add_contribution('Talk', invited=True)
+        conference.contributions.append(Contribution('Direct'))
+        self.assertIn('Direct', conference.ascii())
+        self.assertIn('Direct', conference.html())
+        self.assertEqual(conference.html().count('<br>'), 2)
+
+
+
+class TestPageMenu(unittest.TestCase):
+
+    """Unit tests for the PageMenu class.
+    """
+
+    def test_cache(self):
+        """Make sure the cached html output is invalidated when adding entries.
+        """
+        from webpage.core import PageMenu
+        menu = PageMenu()
+        menu.add_entry('Home', 'index.html', 'fas fa-home')
+        text = menu.html('Home')
+        self.assertIs(menu.html('Home'), text)
+        menu.add_entry('Links', 'links.html')
+        self.assertNotEqual(menu.html('Home'), text)
+        self.assertEqual(len(menu), 2)
+        self.assertEqual([entry.title for entry in menu], ['Home', 'Links'])
+
+    def test_indent(self):
+        """Make sure rendering the menu at a given indentation level is
+        equivalent to indenting the output after the fact.
+        """
+        from webpage.core import PageMenu, HTML
+        menu = PageMenu()
+        menu.add_entry('Home', 'index.html', 'fas fa-home')
+        menu.add_entry('Links', 'links.html')
+        for indent in (0, 1, 4):
+            self.assertEqual(menu.html('Home', indent), HTML.indent(menu.html('Home'), indent))
 
 
 if __name__ == '__main__':
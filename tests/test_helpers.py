@@ -18,8 +18,233 @@
 """Test suite for the helpers module.
 """
 
+import errno
+import os
+import tempfile
 import unittest
 
+from unittest import mock
+
+
+class TestCopy(unittest.TestCase):
+
+    """Unit tests for the copy() function.
+    """
+
+    def setUp(self):
+        """Create a temporary folder with a source file.
+        """
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.src = os.path.join(self._tmp_dir.name, 'src.txt')
+        self.dest = os.path.join(self._tmp_dir.name, 'dest.txt')
+        with open(self.src, 'w') as output_file:
+            output_file.write('Source')
+
+    def tearDown(self):
+        """Remove the temporary folder.
+        """
+        self._tmp_dir.cleanup()
+
+    def _read(self, file_path: str) -> str:
+        """Return the content of a file.
+        """
+        with open(file_path) as input_file:
+            return input_file.read()
+
+    def test_link(self):
+        """Hard-link a file to a fresh destination.
+        """
+        from webpage.helpers import copy
+        copy(self.src, self.dest, hardlink=True)
+        self.assertTrue(os.path.samefile(self.src, self.dest))
+        self.assertEqual(self._read(self.dest), 'Source')
+
+    def test_replace_copy(self):
+        """Make sure a stale regular copy is replaced by a link.
+        """
+        from webpage.helpers import copy
+        with open(self.dest, 'w') as output_file:
+            output_file.write('Stale')
+        copy(self.src, self.dest, hardlink=True, force=True)
+        self.assertTrue(os.path.samefile(self.src, self.dest))
+        self.assertEqual(self._read(self.dest), 'Source')
+
+    def test_already_linked(self):
+        """Make sure linking over an existing link is a no-op.
+        """
+        from webpage.helpers import copy
+        os.link(self.src, self.dest)
+        inode = os.stat(self.dest).st_ino
+        copy(self.src, self.dest, hardlink=True, force=True)
+        self.assertEqual(os.stat(self.dest).st_ino, inode)
+        self.assertTrue(os.path.samefile(self.src, self.dest))
+
+    def test_copy_over_link(self):
+        """Make sure a plain copy over an existing link does not fail.
+        """
+        from webpage.helpers import copy
+        os.link(self.src, self.dest)
+        copy(self.src, self.dest, hardlink=False, force=True)
+        self.assertTrue(os.path.samefile(self.src, self.dest))
+        self.assertEqual(self._read(self.dest), 'Source')
+
+    def test_link_fallback(self):
+        """Make sure we fall back to a regular copy when linking is not possible
+        (e.g., across file systems).
+        """
+        from webpage.helpers import copy
+        with mock.patch('os.link', side_effect=OSError(errno.EXDEV, 'Cross-device link')):
+            copy(self.src, self.dest, hardlink=True)
+        self.assertFalse(os.path.samefile(self.src, self.dest))
+        self.assertEqual(self._read(self.dest), 'Source')
+
+    def test_copy(self):
+        """Plain copy to a fresh destination.
+        """
+        from webpage.helpers import copy
+        copy(self.src, self.dest)
+        self.assertFalse(os.path.samefile(self.src, self.dest))
+        self.assertEqual(self._read(self.dest), 'Source')
+
+    def test_up_to_date(self):
+        """Make sure the copy is skipped if the destination is up to date,
+        unless it is forced.
+        """
+        from webpage.helpers import copy
+        with open(self.dest, 'w') as output_file:
+            output_file.write('Newer')
+        copy(self.src, self.dest)
+        self.assertEqual(self._read(self.dest), 'Newer')
+        copy(self.src, self.dest, force=True)
+        self.assertEqual(self._read(self.dest), 'Source')
+
+
+
+class TestUpToDate(unittest.TestCase):
+
+    """Unit tests for the up_to_date() function.
+    """
+
+    def setUp(self):
+        """Create a temporary folder with a few files with given mtimes.
+        """
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        for file_name, mtime in (('old', 1000.), ('target', 2000.), ('new', 3000.)):
+            file_path = os.path.join(self._tmp_dir.name, file_name)
+            with open(file_path, 'w') as output_file:
+                output_file.write(file_name)
+            os.utime(file_path, (mtime, mtime))
+
+    def tearDown(self):
+        """Remove the temporary folder.
+        """
+        self._tmp_dir.cleanup()
+
+    def _path(self, file_name: str) -> str:
+        """Return the path to a file in the temporary folder.
+        """
+        return os.path.join(self._tmp_dir.name, file_name)
+
+    def test_missing_target(self):
+        """A missing target is never up to date.
+        """
+        from webpage.helpers import up_to_date
+        self.assertFalse(up_to_date(self._path('missing'), self._path('old')))
+
+    def test_missing_source(self):
+        """A missing source makes the target out of date.
+        """
+        from webpage.helpers import up_to_date
+        self.assertFalse(up_to_date(self._path('target'), self._path('missing')))
+        self.assertFalse(up_to_date(self._path('target'), self._path('old'), self._path('missing')))
+
+    def test_mtime(self):
+        """Compare the target with older, newer and equally old sources.
+        """
+        from webpage.helpers import up_to_date
+        self.assertTrue(up_to_date(self._path('target'), self._path('old')))
+        self.assertTrue(up_to_date(self._path('target'), self._path('target')))
+        self.assertFalse(up_to_date(self._path('target'), self._path('new')))
+
+    def test_multiple_sources(self):
+        """The target is up to date only if it is not older than all the sources.
+        """
+        from webpage.helpers import up_to_date
+        self.assertTrue(up_to_date(self._path('target'), self._path('old'), self._path('old')))
+        self.assertFalse(up_to_date(self._path('target'), self._path('old'), self._path('new')))
+        self.assertFalse(up_to_date(self._path('target'), self._path('new'), self._path('old')))
+
+    def test_no_sources(self):
+        """An existing target with no sources is up to date.
+        """
+        from webpage.helpers import up_to_date
+        self.assertTrue(up_to_date(self._path('target')))
+        self.assertFalse(up_to_date(self._path('missing')))
+
+
+
+class TestMtimeCache(unittest.TestCase):
+
+    """Unit tests for the mtime_cache() decorator.
+    """
+
+    def test_cache(self):
+        """Make sure the output is cached until the file changes on disk.
+        """
+        from webpage.helpers import mtime_cache
+        calls = []
+
+        @mtime_cache
+        def read(file_path: str) -> str:
+            calls.append(file_path)
+            with open(file_path) as input_file:
+                return input_file.read()
+
+        with tempfile.TemporaryDirectory() as folder:
+            file_path = os.path.join(folder, 'file.txt')
+            with open(file_path, 'w') as output_file:
+                output_file.write('First')
+            os.utime(file_path, (1000., 1000.))
+            self.assertEqual(read(file_path), 'First')
+            self.assertEqual(read(file_path), 'First')
+            self.assertEqual(len(calls), 1)
+            with open(file_path, 'w') as output_file:
+                output_file.write('Second')
+            os.utime(file_path, (2000., 2000.))
+            self.assertEqual(read(file_path), 'Second')
+            self.assertEqual(len(calls), 2)
+            with self.assertRaises(FileNotFoundError):
+                read(os.path.join(folder, 'missing.txt'))
+class TestJson(unittest.TestCase):
+
+    """Unit tests for the json helper functions.
+    """
+
+    DATA = {'title': 'Vallée', 'authors': ['Ö. Smith', 'J. Doe'], 'year': 2019,
+            'volume': None, 'refereed': True, 'a': {'z': 1.5, 'b': []}}
+
+    def test_roundtrip(self):
+        """Serialize and parse back a json document.
+        """
+        from webpage.helpers import json_dumps, json_loads
+        for indent in (False, True):
+            for sort_keys in (False, True):
+                self.assertEqual(json_loads(json_dumps(self.DATA, indent, sort_keys)), self.DATA)
+
+    def test_backends(self):
+        """Make sure the orjson and the standard library backends produce the
+        very same bytes.
+        """
+        from webpage import helpers
+        if helpers.json_dumps is helpers._stdlib_json_dumps:
+            self.skipTest('orjson is not available')
+        for indent in (False, True):
+            for sort_keys in (False, True):
+                self.assertEqual(helpers.json_dumps(self.DATA, indent, sort_keys),
+                                 helpers._stdlib_json_dumps(self.DATA, indent, sort_keys))
+        text = helpers.json_dumps(self.DATA)
+        self.assertEqual(helpers.json_loads(text), helpers._stdlib_json_loads(text))
+        self.assertIn('Vallée'.encode('utf-8'), text)
 
 
 
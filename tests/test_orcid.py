@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019 Luca Baldini (luca.baldini@pi.infn.it)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Test suite for the orcid module.
+"""
+
+import importlib.util
+import json
+import os
+import tempfile
+import unittest
+
+from unittest import mock
+
+
+# The orcid module needs a couple of third-party packages to be imported.
+HAS_ORCID_DEPENDENCIES = all(importlib.util.find_spec(name) is not None
+                             for name in ('loguru', 'requests'))
+
+
+
+@unittest.skipUnless(HAS_ORCID_DEPENDENCIES, 'loguru and requests are required')
+class TestORCID(unittest.TestCase):
+
+    """Unit tests for the population of the ORCID work list.
+    """
+
+    ORCID_ID = '0000-0000-0000-0000'
+    PUT_CODES = (101, 102, 103, 104, 105)
+    CACHED_PUT_CODES = (101, 103)
+
+    def setUp(self):
+        """Create a temporary local folder with the top-level ORCID data and
+        a subset of the works cached.
+        """
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        group = [{'work-summary': [{'put-code': put_code, 'path': self._path(put_code)}]}
+                 for put_code in self.PUT_CODES]
+        self._dump({'activities-summary': {'works': {'group': group}}}, f'{self.ORCID_ID}.json')
+        for put_code in self.CACHED_PUT_CODES:
+            self._dump(self._work(put_code), self._work_file_name(put_code))
+
+    def tearDown(self):
+        """Remove the temporary local folder.
+        """
+        self._tmp_dir.cleanup()
+
+    def _path(self, put_code: int) -> str:
+        """Return the ORCID path for a given work.
+        """
+        return f'/{self.ORCID_ID}/work/{put_code}'
+
+    def _work_file_name(self, put_code: int) -> str:
+        """Return the name of the local file for a given work.
+        """
+        return f'{self.ORCID_ID}-work-{put_code}.json'
+
+    def _dump(self, data: dict, file_name: str) -> None:
+        """Write some data to a json file in the temporary local folder.
+        """
+        with open(os.path.join(self._tmp_dir.name, file_name), 'w') as output_file:
+            json.dump(data, output_file)
+
+    def _work(self, put_code: int) -> dict:
+        """Return the minimal json data for a work.
+
+        Mind all the works share the same publication date, so that the (stable)
+        sort at the end of the ORCID constructor preserves the original order.
+        """
+        return {
+            'path': self._path(put_code),
+            'title': {'title': {'value': f'Work {put_code}'}},
+            'publication-date': {'year': {'value': '2000'}, 'month': None, 'day': None},
+            'type': 'journal-article',
+            'journal-title': {'value': 'Journal'},
+            'external-ids': {'external-id': []},
+            'contributors': {'contributor': [{'credit-name': {'value': 'L. Baldini'}}]},
+            'citation': None
+            }
+
+    def _orcid(self, get):
+        """Create an ORCID object in the temporary local folder, with the
+        given replacement for requests.Session.get().
+        """
+        import requests
+        from webpage.orcid import ORCID
+        with mock.patch.object(ORCID, 'LOCAL_FOLDER', self._tmp_dir.name), \
+             mock.patch.object(requests.Session, 'get', autospec=True, side_effect=get) as mock_get:
+            return ORCID(self.ORCID_ID), mock_get
+
+    def test_work_list(self):
+        """Make sure the cached works are read and the missing ones are fetched,
+        preserving the original order.
+        """
+        def get(_, url, **kwargs):
+            put_code = int(url.split('/')[-1])
+            return mock.Mock(content=json.dumps(self._work(put_code)).encode())
+
+        orcid, mock_get = self._orcid(get)
+        titles = [work.title for work in orcid.work_list]
+        self.assertEqual(titles, [f'Work {put_code}' for put_code in self.PUT_CODES])
+        fetched = sorted(call.args[1] for call in mock_get.call_args_list)
+        missing = [put_code for put_code in self.PUT_CODES if put_code not in self.CACHED_PUT_CODES]
+        self.assertEqual(fetched, [orcid._url(self._path(put_code)) for put_code in missing])
+        # And the fetched works are now cached locally.
+        for put_code in self.PUT_CODES:
+            file_path = os.path.join(self._tmp_dir.name, self._work_file_name(put_code))
+            self.assertTrue(os.path.exists(file_path))
+
+    def test_failing_fetch(self):
+        """Make sure an exception in a fetch propagates to the caller.
+        """
+        import requests
+
+        def get(_, url, **kwargs):
+            put_code = int(url.split('/')[-1])
+            if put_code == self.PUT_CODES[-1]:
+                raise requests.ConnectionError(url)
+            return mock.Mock(content=json.dumps(self._work(put_code)).encode())
+
+        with self.assertRaises(requests.ConnectionError):
+            self._orcid(get)
+
+
+
+if __name__ == '__main__':
+    unittest.main()
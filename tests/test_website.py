@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019 Luca Baldini (luca.baldini@pi.infn.it)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Test suite for the website module.
+"""
+
+import os
+import tempfile
+import unittest
+
+from unittest import mock
+
+
+class TestTemplate(unittest.TestCase):
+
+    """Unit tests for the page template parsing.
+    """
+
+    TEMPLATE = '<{name!r}> {title} {{{number:05.1f}}} {menu}\n{content} {name!s:>6}|'
+
+    @staticmethod
+    def _render(parts: tuple, values: dict) -> str:
+        """Render a parsed template the same way _write_page() does.
+        """
+        text = ''
+        for literal, field_name in parts:
+            text += literal
+            if field_name is not None:
+                text += values[field_name]
+        return text
+
+    def test_parse(self):
+        """Compare a parsed and rendered template with str.format().
+        """
+        from webpage.website import parse_template
+        fields = {'name': 'Luca', 'number': 3.14159}
+        values = {'title': 'Title', 'menu': 'Menu', 'content': '{Content}'}
+        parts = parse_template(self.TEMPLATE, fields)
+        self.assertEqual([field_name for _, field_name in parts], ['title', 'menu', 'content', None])
+        self.assertEqual(self._render(parts, values), self.TEMPLATE.format(**fields, **values))
+
+    def test_formatted_page_field(self):
+        """Make sure a conversion or format specification on a page field is
+        not silently dropped.
+        """
+        from webpage.website import parse_template
+        for text in ('{title!r}', '{content:>10}'):
+            with self.assertRaises(ValueError):
+                parse_template(text, {})
+
+
+
+class TestWritePage(unittest.TestCase):
+
+    """Unit tests for the streamed page write.
+    """
+
+    def setUp(self):
+        """Create a temporary output folder.
+        """
+        self._tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        """Remove the temporary output folder.
+        """
+        self._tmp_dir.cleanup()
+
+    def _output_file_path(self, file_name: str) -> str:
+        """Replacement for webpage.output_file_path() pointing to the
+        temporary folder.
+        """
+        return os.path.join(self._tmp_dir.name, file_name)
+
+    def _write(self, *args, **kwargs) -> str:
+        """Write a page into the temporary folder and return its content.
+        """
+        import webpage
+        from webpage.website import _write_page
+        with mock.patch.object(webpage, 'output_file_path', self._output_file_path):
+            _write_page(*args, **kwargs)
+        with open(self._output_file_path(args[1]), encoding='utf-8') as input_file:
+            return input_file.read()
+
+    @staticmethod
+    def _expected(title: str, target: str, hook_output: str = None, language: str = 'en') -> str:
+        """Build the expected page in memory with str.format().
+        """
+        import webpage
+        from webpage.core import HTML
+        from webpage.website import MENU, template_fields
+        content = HTML.indent(webpage.read_content(target), 4)
+        if hook_output is not None:
+            content = f'{content}\n{hook_output}'
+        return webpage.read_content('template.html').format(
+            **template_fields(), language=language, title=title,
+            menu=MENU.html(title, 4), content=content)
+
+    def test_write(self):
+        """Compare a streamed page with the same page built via str.format().
+        """
+        self.assertEqual(self._write('Links', 'links.html'), self._expected('Links', 'links.html'))
+
+    def test_hook(self):
+        """Make sure the output of the hook is appended to the content.
+        """
+        text = self._write('Links', 'links.html', lambda: '<p>Hook</p>')
+        self.assertEqual(text, self._expected('Links', 'links.html', '<p>Hook</p>'))
+
+
+    def test_up_to_date(self):
+        """Make sure a page newer than its content and all the common
+        dependencies is skipped, unless it is forced.
+        """
+        import webpage
+        from webpage.website import _page_dependencies
+        expected = self._expected('Links', 'links.html')
+        file_path = self._output_file_path('links.html')
+        with open(file_path, 'w', encoding='utf-8') as output_file:
+            output_file.write('Stale')
+        sources = (webpage.content_file_path('links.html'), *_page_dependencies())
+        mtime = max(os.path.getmtime(source) for source in sources) + 10.
+        os.utime(file_path, (mtime, mtime))
+        self.assertEqual(self._write('Links', 'links.html', force=False), 'Stale')
+        self.assertEqual(self._write('Links', 'links.html', force=True), expected)
+        # And an old page is rewritten, even if not forced.
+        with open(file_path, 'w', encoding='utf-8') as output_file:
+            output_file.write('Stale')
+        os.utime(file_path, (0., 0.))
+        self.assertEqual(self._write('Links', 'links.html', force=False), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
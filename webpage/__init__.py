@@ -23,14 +23,21 @@ utility functions.
 import os
 import logging
 
-from webpage.helpers import mktree
+from concurrent.futures import ThreadPoolExecutor
+
+from webpage.helpers import mktree, mtime_cache
 
 from .version import version as __version__
 
 
 # Basic local environment.
 #
-BASE_FOLDER = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+# Mind __file__ is guaranteed to be an absolute path for imported modules since
+# Python 3.9, in which case we can avoid the os.path.abspath() call (and the
+# underlying getcwd() syscall). The fallback is there just in case.
+BASE_FOLDER = os.path.dirname(os.path.dirname(__file__))
+if not os.path.isabs(BASE_FOLDER):
+    BASE_FOLDER = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
 
 
 def _join(*args) -> str:
@@ -43,21 +50,36 @@ def _join(*args) -> str:
 # Input folders.
 CONTENTS_FOLDER = _join('contents')
 CSS_FOLDER_NAME = 'css'
-CSS_FOLDER = _join(BASE_FOLDER, CSS_FOLDER_NAME)
-DOCS_FOLDER = _join(BASE_FOLDER, 'docs')
+CSS_FOLDER = _join(CSS_FOLDER_NAME)
+DOCS_FOLDER = _join('docs')
 RELEASE_NOTES = os.path.join(DOCS_FOLDER, 'release_notes.rst')
 IMG_FOLDER_NAME = 'images'
-IMG_FOLDER = _join(BASE_FOLDER, IMG_FOLDER_NAME)
+IMG_FOLDER = _join(IMG_FOLDER_NAME)
 MISC_FOLDER_NAME = 'misc'
-MISC_FOLDER = _join(BASE_FOLDER, MISC_FOLDER_NAME)
-ORCID_FOLDER = _join(BASE_FOLDER, 'orcid')
-WEBPAGE_FOLDER = _join(BASE_FOLDER, 'webpage')
+MISC_FOLDER = _join(MISC_FOLDER_NAME)
+ORCID_FOLDER = _join('orcid')
+WEBPAGE_FOLDER = _join('webpage')
+
+
+_CONTENTS_PREFIX = f'{CONTENTS_FOLDER}{os.sep}'
 
 
 def content_file_path(file_name: str) -> str:
     """Return the path to a content file path.
+
+    Since this is called with a single (relative) file name, we can get away
+    with a plain string concatenation, rather than an os.path.join() call.
     """
-    return os.path.join(CONTENTS_FOLDER, file_name)
+    return _CONTENTS_PREFIX + file_name
+
+
+@mtime_cache
+def _read_file(file_path: str) -> str:
+    """Read a text file and return its content verbatim.
+    """
+    logging.info('Reading page content from %s...', file_path)
+    with open(file_path, 'r') as input_file:
+        return input_file.read()
 
 
 def read_content(file_name: str) -> str:
@@ -66,36 +88,45 @@ def read_content(file_name: str) -> str:
     This is reading the local html file pointed by the function argument and
     returning its content verbatim. Mind we're passing the file by name and not
     by the full path. The file is assumed to live in the CONTENTS_FOLDER.
+
+    The content is cached, and only read again from disk when the modification
+    time of the file changes.
     """
-    content = ''
     file_path = content_file_path(file_name)
-    if not os.path.exists(file_path):
+    try:
+        return _read_file(file_path)
+    except FileNotFoundError:
         logging.warning('Could not find %s.', file_path)
-        return content
-    logging.info('Reading page content from %s...', file_path)
-    with open(file_path, 'r') as input_file:
-        content = input_file.read()
-    return content
+        return ''
 
 
 # Output folders
-OUTPUT_FOLDER = _join(BASE_FOLDER, 'html')
-OUTPUT_CSS_FOLDER = _join(OUTPUT_FOLDER, CSS_FOLDER_NAME)
-OUTPUT_IMG_FOLDER = _join(OUTPUT_FOLDER, IMG_FOLDER_NAME)
-OUTPUT_MISC_FOLDER = _join(OUTPUT_FOLDER, MISC_FOLDER_NAME)
+OUTPUT_FOLDER = _join('html')
+OUTPUT_CSS_FOLDER = _join('html', CSS_FOLDER_NAME)
+OUTPUT_IMG_FOLDER = _join('html', IMG_FOLDER_NAME)
+OUTPUT_MISC_FOLDER = _join('html', MISC_FOLDER_NAME)
+_OUTPUT_PREFIX = f'{OUTPUT_FOLDER}{os.sep}'
 
 
 def create_local_tree() -> None:
     """Create the necessary local tree for the html output, if necessary.
+
+    Mind the folders are created concurrently, which is safe as mktree() is
+    creating any missing intermediate folder, and is tolerant to the folder
+    being created in the meantime.
     """
-    for folder in (OUTPUT_FOLDER, OUTPUT_CSS_FOLDER, OUTPUT_IMG_FOLDER, OUTPUT_MISC_FOLDER):
-        mktree(folder)
+    folders = (OUTPUT_FOLDER, OUTPUT_CSS_FOLDER, OUTPUT_IMG_FOLDER, OUTPUT_MISC_FOLDER)
+    with ThreadPoolExecutor(max_workers=len(folders)) as executor:
+        list(executor.map(mktree, folders))
 
 
 def output_file_path(*args: str) -> str:
     """Build paths to output files.
 
     This is essentially concatenanting the args to the output foder, in the
-    os.path.join sense.
+    os.path.join sense (with a fast path for the common case of a single
+    file name).
     """
+    if len(args) == 1:
+        return _OUTPUT_PREFIX + args[0]
     return os.path.join(OUTPUT_FOLDER, *args)
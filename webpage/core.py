@@ -19,9 +19,55 @@
 """
 
 import datetime
+import functools
+import io
+import itertools
+import operator
 import os
+import sys
 
-from typing import Optional, List
+from dataclasses import dataclass, field, InitVar
+from typing import Optional, List, Dict, Tuple
+
+
+# Static fragments for the most common inline formatting commands. These are
+# interned once and forever so that the very same objects are reused in all
+# the formatted strings.
+#
+_LATEX_EMPH_OPEN = sys.intern('\\emph{')
+_LATEX_BOLD_OPEN = sys.intern('\\textbf{')
+_LATEX_TYPESET_OPEN = sys.intern('\\texttt{')
+_LATEX_CLOSE = sys.intern('}')
+_HTML_BR = sys.intern('<br>')
+
+# Translation tables for escaping the special characters in free text.
+#
+_HTML_ESCAPE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;'})
+_LATEX_ESCAPE = str.maketrans({'%': '\\%', '_': '\\_', '$': '\\$', '&': '\\&', '#': '\\#'})
+
+
+# Specialized formatters for LaTeX commands, indexed by the number of arguments.
+#
+_LATEX_COMMANDS = {
+    0: lambda name: f'\\{name}',
+    1: lambda name, arg: f'\\{name}{{{arg}}}',
+    2: lambda name, arg1, arg2: f'\\{name}{{{arg1}}}{{{arg2}}}'
+}
+
+
+@functools.cache
+def _latex_href(url: str, text: str) -> str:
+    """Cached LaTeX hyperlink (the same urls tend to recur over and over again
+    across the website).
+    """
+    return f'\\href{{{url}}}{{{text}}}'
+
+
+@functools.cache
+def _html_link(url: str, text: str) -> str:
+    """Cached HTML hyperlink (see _latex_href()).
+    """
+    return f'<a href="{url}">{text}</a>'
 
 
 class LaTeX:
@@ -49,26 +95,34 @@ class LaTeX:
         text : str
             The text of the LaTeX command.
         """
-        text = '\\{}{}'.format(name, '{{{}}}' * len(args))
-        return text.format(*args)
+        try:
+            return _LATEX_COMMANDS[len(args)](name, *args)
+        except KeyError:
+            return f'\\{name}' + ''.join([f'{{{arg}}}' for arg in args])
+
+    @staticmethod
+    def escape(text: str) -> str:
+        """Escape the LaTeX special characters in a piece of free text.
+        """
+        return text.translate(_LATEX_ESCAPE)
 
     @classmethod
     def emph(cls, text: str) -> str:
         """Italic formatting.
         """
-        return cls.command('emph', text)
+        return f'{_LATEX_EMPH_OPEN}{text}{_LATEX_CLOSE}'
 
     @classmethod
     def bold(cls, text: str) -> str:
         """Bold formatting.
         """
-        return cls.command('textbf', text)
+        return f'{_LATEX_BOLD_OPEN}{text}{_LATEX_CLOSE}'
 
     @classmethod
     def typeset(cls, text: str) -> str:
         """Typewriter formatting.
         """
-        return cls.command('texttt', text)
+        return f'{_LATEX_TYPESET_OPEN}{text}{_LATEX_CLOSE}'
 
     @classmethod
     def hyperlink(cls, text: str, url: Optional[str] = None) -> str:
@@ -78,7 +132,7 @@ class LaTeX:
         """
         if url is None:
             return text
-        return cls.command('href', url, text)
+        return _latex_href(url, text)
 
 
 
@@ -89,7 +143,65 @@ class HTML:
     This is implemented in the very same fashion as the LaTeX class.
     """
 
-    INDENT_STRING = '  '
+    INDENT_STRING = sys.intern('  ')
+    # Line break (this is also available through the break_() method).
+    BR = _HTML_BR
+    # Pre-computed indentation strings (and the same strings prepended with a
+    # newline), indexed by level.
+    _INDENTS = tuple(map(INDENT_STRING.__mul__, range(32)))
+    _NL_INDENTS = tuple(map('\n'.__add__, _INDENTS))
+    # Caches of the formatted open (with no attributes) and close tags,
+    # indexed by (tag, indent).
+    _OPEN_CACHE: Dict[Tuple[str, int], str] = {}
+    _CLOSE_CACHE: Dict[Tuple[str, int], str] = {}
+
+    @staticmethod
+    def _tag_renderer(tag: str):
+        """Return a rendering function specialized for a given html tag.
+
+        The open and close tags are formatted (and interned) once and forever, and
+        the returned function only falls back to the generic _tag() machinery when
+        attributes other than the class are passed. The signature is the same as
+        that of _tag(), minus the tag itself. (Mind this is used in the class body
+        itself, to create the specialized renderers below.)
+        """
+        open_tag = sys.intern(f'<{tag}>')
+        close_tag = sys.intern(f'</{tag}>')
+
+        def render(text: str, indent: int, class_: Optional[str], attributes: dict) -> str:
+            """Specialized tag renderer.
+            """
+            if attributes:
+                return HTML._tag(text, tag, indent, class_, attributes)
+            # Mind that, consistently with HTML.tag(), only the open tag is indented.
+            prefix = HTML.indent_string(indent)
+            if class_ is None:
+                return f'{prefix}{open_tag}{text}{close_tag}'
+            return f'{prefix}<{tag} class="{class_}">{text}{close_tag}'
+
+        render.__name__ = f'_render_{tag}'
+        return render
+
+    # Specialized renderers for the most common tags.
+    _render_h3 = staticmethod(_tag_renderer('h3'))
+    _render_em = staticmethod(_tag_renderer('em'))
+    _render_b = staticmethod(_tag_renderer('b'))
+    _render_i = staticmethod(_tag_renderer('i'))
+    _render_tt = staticmethod(_tag_renderer('tt'))
+    _render_li = staticmethod(_tag_renderer('li'))
+
+    @classmethod
+    def indent_string(cls, level: int) -> str:
+        """Return the indentation string for a given level.
+
+        This is a lookup in the pre-computed table for all the practical
+        purposes, with a fallback for very deep (or negative) indentation
+        levels. (Mind a negative level yields an empty string, and the table
+        cannot be indexed with it.)
+        """
+        if 0 <= level < len(cls._INDENTS):
+            return cls._INDENTS[level]
+        return cls.INDENT_STRING * level
 
     @classmethod
     def indent(cls, text: str, level: int = 0) -> str:
@@ -101,32 +213,59 @@ class HTML:
         # If no indentation is required, do nothing.
         if level == 0:
             return text
-        # Calculate the indentation.
-        indent = cls.INDENT_STRING * level
-        # Prepend the right number of spaces to each new line.
-        text = text.replace('\n', '\n{}'.format(indent))
-        # Prepend the right number of spaces to the paragraph itself.
-        text = '{}{}'.format(indent, text)
-        return text
+        # Prepend the right number of spaces to the paragraph itself and to
+        # each new line (if any---single-line text, e.g., a single tag, is by
+        # far the most common case, and we can skip the replace() pass).
+        if 0 <= level < len(cls._INDENTS):
+            if '\n' not in text:
+                return cls._INDENTS[level] + text
+            return cls._INDENTS[level] + text.replace('\n', cls._NL_INDENTS[level])
+        prefix = cls.INDENT_STRING * level
+        return prefix + text.replace('\n', f'\n{prefix}')
 
     @classmethod
     def tag_open(cls, tag: str, indent: int = 0, class_: Optional[str] = None,
                  **attributes) -> str:
         """Open tag formatting.
         """
+        return cls._tag_open(tag, indent, class_, attributes)
+
+    @classmethod
+    def _tag_open(cls, tag: str, indent: int, class_: Optional[str],
+                  attributes: dict) -> str:
+        """Implementation of tag_open().
+
+        Mind the attributes are passed as a plain dictionary, so that they do
+        not get unpacked and re-packed as keyword arguments at each step of the
+        call chain. (The dictionary is modified in place, so this should only
+        be called with the fresh keyword-argument dictionary of a public method.)
+        """
+        # Fast paths for the (most common) cases where no attribute other
+        # than (possibly) the class is passed.
+        if not attributes:
+            if class_ is None:
+                try:
+                    return cls._OPEN_CACHE[tag, indent]
+                except KeyError:
+                    text = cls.indent(f'<{tag}>', indent)
+                    cls._OPEN_CACHE[tag, indent] = text
+                    return text
+            return cls.indent(f'<{tag} class="{class_}">', indent)
         if class_ is not None:
-            attributes.update({'class': class_})
-        attr_list = [' {}="{}"'.format(*item) for item in attributes.items()]
-        attr_text = ','.join(attr_list)
-        text = '<{}{}>'.format(tag, attr_text)
-        return cls.indent(text, indent)
+            attributes['class'] = class_
+        attr_text = ''.join([f' {key}="{value}"' for key, value in attributes.items()])
+        return cls.indent(f'<{tag}{attr_text}>', indent)
 
     @classmethod
     def tag_close(cls, tag: str, indent: int = 0) -> str:
         """Close tag formatting.
         """
-        text = '</{}>'.format(tag)
-        return cls.indent(text, indent)
+        try:
+            return cls._CLOSE_CACHE[tag, indent]
+        except KeyError:
+            text = cls.indent(f'</{tag}>', indent)
+            cls._CLOSE_CACHE[tag, indent] = text
+            return text
 
     @classmethod
     def tag(cls, text: str, tag: str, indent: int = 0, class_: str = None,
@@ -138,35 +277,61 @@ class HTML:
         and cannot be passed directly as a key (we would have to build a
         dictionary manually every time).
         """
-        return '{}{}{}'.format(cls.tag_open(tag, indent, class_, **attributes),
-                               text, cls.tag_close(tag))
+        return cls._tag(text, tag, indent, class_, attributes)
+
+    @classmethod
+    def _tag(cls, text: str, tag: str, indent: int, class_: Optional[str],
+             attributes: dict) -> str:
+        """Implementation of tag(), with the attributes passed as a dictionary
+        (see the comments in _tag_open()).
+
+        Mind the whole thing is rendered in place, with a single join for the
+        attributes and a single f-string for the tag (consistently with tag_open(),
+        only the open tag is indented).
+        """
+        prefix = cls.indent_string(indent)
+        # Fast path for the case with no attributes other than the class.
+        if not attributes:
+            if class_ is None:
+                return f'{prefix}<{tag}>{text}</{tag}>'
+            return f'{prefix}<{tag} class="{class_}">{text}</{tag}>'
+        if class_ is not None:
+            attributes['class'] = class_
+        attr_text = ''.join([f' {key}="{value}"' for key, value in attributes.items()])
+        return f'{prefix}<{tag}{attr_text}>{text}</{tag}>'
 
     @classmethod
     def heading3(cls, text: str, indent: int = 0, class_: str = None,
                  **attributes) -> str:
         """H3 tag.
         """
-        return cls.tag(text, 'h3', indent, class_, **attributes)
+        return cls._render_h3(text, indent, class_, attributes)
 
     @staticmethod
     def break_() -> str:
         """Line break.
         """
-        return '<br>'
+        return _HTML_BR
+
+    @staticmethod
+    def escape(text: str) -> str:
+        """Escape the HTML special characters in a piece of free text.
+        """
+        return text.translate(_HTML_ESCAPE)
 
     @classmethod
     def emph(cls, text: str, indent: int = 0, class_: str = None,
              **attributes) -> str:
         """Italic formatting.
         """
-        return cls.tag(text, 'em', indent, class_, **attributes)
+        return cls._render_em(text, indent, class_, attributes)
 
     @classmethod
     def bold(cls, text: str, indent: int = 0, class_: str = None,
              **attributes) -> str:
         """Bold formatting.
         """
-        return cls.tag(text, 'b', indent, class_, **attributes)
+        return cls._render_b(text, indent, class_, attributes)
 
     @classmethod
     def italic(cls, text: str = '', indent: int = 0, class_: str = None,
@@ -176,21 +341,21 @@ class HTML:
         Mind in HTML 5 this is customarily used for other inline elements, such
         as icons.
         """
-        return cls.tag(text, 'i', indent, class_, **attributes)
+        return cls._render_i(text, indent, class_, attributes)
 
     @classmethod
     def typeset(cls, text: str, indent: int = 0, class_: str = None,
                 **attributes) -> str:
         """Monospace formatting.
         """
-        return cls.tag(text, 'tt', indent, class_, **attributes)
+        return cls._render_tt(text, indent, class_, attributes)
 
     @classmethod
     def list_item(cls, text: str, indent: int = 0, class_: str = None,
                   **attributes) -> str:
         """List item formatting.
         """
-        return cls.tag(text, 'li', indent, class_, **attributes)
+        return cls._render_li(text, indent, class_, attributes)
 
     @classmethod
     def list(cls, items: List, indent: int = 0, ul_class: Optional[str] = None,
@@ -202,11 +367,14 @@ class HTML:
         formatting (e.g., where different list items have different attributes)
         are not supported.
         """
-        lines = [cls.tag_open('ul', indent, ul_class)]
-        for item in items:
-            lines.append('{}'.format(cls.list_item(item, indent + 1, li_class)))
-        lines.append(cls.tag_close('ul', indent))
-        return '\n'.join(lines)
+        # Mind the list is rendered in a single pass, with all the (indented)
+        # open tags formatted once and for all outside the loop.
+        outer = cls.indent_string(indent)
+        inner = cls.indent_string(indent + 1)
+        ul_open = '<ul>' if ul_class is None else f'<ul class="{ul_class}">'
+        li_open = '<li>' if li_class is None else f'<li class="{li_class}">'
+        lines = [f'{inner}{li_open}{item}</li>' for item in items]
+        return '\n'.join([f'{outer}{ul_open}', *lines, f'{outer}</ul>'])
 
     @classmethod
     def hyperlink(cls, text: str, url: Optional[str] = None,
@@ -217,7 +385,9 @@ class HTML:
         """
         if url is None:
             return text
-        return cls.tag(text, 'a', indent, href=url)
+        if indent == 0:
+            return _html_link(url, text)
+        return cls._tag(text, 'a', indent, None, {'href': url})
 
 
 
@@ -243,15 +413,22 @@ class PageMenuEntry:
     (The output of the function is added verbatim to the corresponding page.)
     """
 
+    __slots__ = ('title', 'target', 'icon', 'hook', 'language', '_html_cache')
+
     def __init__(self, title: str, target: str, icon: Optional[str] = None,
                  hook=None, language: str = 'en') -> None:
         """Constructor.
+
+        Mind the title and target are interned, as they are used over and over
+        again as dictionary keys and in comparisons when rendering the pages.
         """
-        self.title = title
-        self.target = target
+        self.title = sys.intern(title)
+        self.target = sys.intern(target)
         self.icon = icon
         self.hook = hook
         self.language = language
+        # Cache for the html output, indexed by (link_active, indent).
+        self._html_cache: Dict[Tuple[bool, int], str] = {}
 
     def points_to_file(self) -> bool:
         """Return True if the target is a html file name (i.e., not a folder).
@@ -271,10 +448,24 @@ class PageMenuEntry:
     def ascii(self) -> str:
         """ASCII formatting.
         """
-        return '{} -> {}'.format(self.title, self.target)
+        return f'{self.title} -> {self.target}'
 
     def html(self, link_active: bool, indent: int) -> str:
         """HTML formatting.
+
+        Menu entries are not supposed to change after creation, and the very
+        same menu is rendered for each and every page of the website, so the
+        output is cached.
+        """
+        try:
+            return self._html_cache[link_active, indent]
+        except KeyError:
+            text = self._html(link_active, indent)
+            self._html_cache[link_active, indent] = text
+            return text
+
+    def _html(self, link_active: bool, indent: int) -> str:
+        """Actual implementation of the html() method.
         """
         if link_active:
             text = HTML.hyperlink(self.title, self.target)
@@ -282,9 +473,12 @@ class PageMenuEntry:
         else:
             text = self.title
             class_ = 'inactive'
+        # Mind the list item (and the icon, if any) are formatted in place, in
+        # a single pass, rather than through the generic HTML helpers.
+        prefix = HTML.indent_string(indent)
         if self.icon is not None:
-            text = '{}{}'.format(HTML.italic(class_=self.icon), text)
-        return HTML.list_item(text, indent, class_=class_)
+            return f'{prefix}<li class="{class_}"><i class="{self.icon}"></i>{text}</li>'
+        return f'{prefix}<li class="{class_}">{text}</li>'
 
     def __str__(self) -> str:
         """String formatting.
@@ -293,36 +487,66 @@ class PageMenuEntry:
 
 
 
-class PageMenu(List[PageMenuEntry]):
+class PageMenu:
 
     """Class representing the logical structure of the page menu.
 
-    A menu is essentially a list of PageMenuEntry instances.
+    A menu is essentially a list of PageMenuEntry instances. (Mind the entries
+    are stored in an internal list, rather than subclassing list, so that the
+    rendered html can be cached and invalidated when a new entry is added.)
     """
 
+    __slots__ = ('_entries', '_html_cache')
+
+    def __init__(self) -> None:
+        """Constructor.
+        """
+        self._entries: List[PageMenuEntry] = []
+        self._html_cache: Dict[Tuple[Optional[str], int], str] = {}
+
+    def __iter__(self):
+        """Iterate over the menu entries.
+        """
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        """Return the number of menu entries.
+        """
+        return len(self._entries)
+
+    def __getitem__(self, index):
+        """Return the menu entry(ies) at a given index (or slice).
+        """
+        return self._entries[index]
+
     def add_entry(self, title: str, target: str, icon: Optional[str] = None,
                   hook=None, language: str = 'en') -> None:
         """Add an entry to the menu.
         """
-        self.append(PageMenuEntry(title, target, icon, hook, language))
+        self._entries.append(PageMenuEntry(title, target, icon, hook, language))
+        self._html_cache.clear()
 
     def ascii(self) -> str:
         """ASCII representation.
         """
-        lines = ['Page menu:']
-        for entry in self:
-            lines.append(entry.ascii())
-        return '\n'.join(lines)
+        return '\n'.join(['Page menu:', *[entry.ascii() for entry in self._entries]])
 
-    def html(self, current_title: Optional[str] = None) -> str:
+    def html(self, current_title: Optional[str] = None, indent: int = 0) -> str:
         """Return the html representation of the menu.
-        """
-        lines = ['<ul>']
-        for entry in self:
-            link_active = (entry.title != current_title)
-            lines.append(entry.html(link_active, 1))
-        lines.append('</ul>')
-        return '\n'.join(lines)
+
+        This is equivalent to HTML.indent(self.html(current_title), indent), but
+        the menu is rendered at the right indentation level in the first place.
+        The output is cached for each value of the current title and indentation.
+        """
+        try:
+            return self._html_cache[current_title, indent]
+        except KeyError:
+            prefix = HTML.indent_string(indent)
+            lines = [entry.html(entry.title != current_title, indent + 1)
+                     for entry in self._entries]
+            text = '\n'.join([f'{prefix}<ul>', *lines, f'{prefix}</ul>'])
+            self._html_cache[current_title, indent] = text
+            return text
 
     def __str__(self) -> str:
         """Text representation.
@@ -331,6 +555,32 @@ class PageMenu(List[PageMenuEntry]):
 
 
 
+# Month names for TimeSpan.date_to_str(). Mind the output is always in english,
+# so we can avoid going through the (locale-aware) strftime() machinery.
+#
+_MONTHS = ('January', 'February', 'March', 'April', 'May', 'June', 'July',
+           'August', 'September', 'October', 'November', 'December')
+
+
+@functools.lru_cache(maxsize=1024)
+def _date_to_str(date: datetime.date, month: bool, year: bool) -> str:
+    """Cached implementation of TimeSpan.date_to_str().
+
+    datetime.date objects are immutable and hashable, and there are only four
+    possible combinations of flags, so we can afford caching the output. (The
+    cache is bounded, as the number of distinct dates is in principle
+    open-ended, but in practice it is way smaller than that.)
+    """
+    if month and year:
+        return f'{date.day:02d} {_MONTHS[date.month - 1]}, {date.year}'
+    if month:
+        return f'{date.day:02d} {_MONTHS[date.month - 1]}'
+    if year:
+        return f'{date.day:02d}, {date.year}'
+    return f'{date.day:02d}'
+
+
+
 class TimeSpan:
 
     """Small utility class representing a time span.
@@ -344,23 +594,37 @@ class TimeSpan:
     dates are identical and the time span is one-day long.
     """
 
+    __slots__ = ('begin_date', 'end_date', '_cache')
+
+    # Mind this is for reference only, as str_to_date() uses the (much faster)
+    # datetime.date.fromisoformat() parser.
     INPUT_FMT = '%Y-%m-%d'
 
     def __init__(self, begin: str, end: Optional[str] = None) -> None:
         """Constructor.
         """
-        if end is None:
-            end = begin
-        self.begin_date = self.str_to_date(begin)
-        self.end_date = self.str_to_date(end)
-        # Make sure we did not get the bounds backward.
-        assert self.end_date >= self.begin_date
+        # Mind the parsing is inlined (rather than going through str_to_date())
+        # to save a method lookup and call per date, and for single-day time
+        # spans the very same date object is reused, rather than parsing the
+        # same string twice.
+        self.begin_date = datetime.date.fromisoformat(begin)
+        if end is None or end == begin:
+            self.end_date = self.begin_date
+        else:
+            self.end_date = datetime.date.fromisoformat(end)
+            # Make sure we did not get the bounds backward (this is skipped
+            # when running with -O).
+            if __debug__ and self.end_date < self.begin_date:
+                raise ValueError(f'TimeSpan end ({end}) precedes begin ({begin})')
+        # Cache for the formatted output, indexed by separator.
+        self._cache = {}
 
-    @classmethod
-    def str_to_date(cls, string: str) -> datetime.date:
-        """Convert an input string to a datetime.date object.
+    @staticmethod
+    def str_to_date(string: str) -> datetime.date:
+        """Convert an input string in the 'YYYY-MM-DD' format to a
+        datetime.date object.
         """
-        return datetime.datetime.strptime(string, cls.INPUT_FMT).date()
+        return datetime.date.fromisoformat(string)
 
     @staticmethod
     def date_to_str(date: datetime.date, month: bool = True,
@@ -372,12 +636,7 @@ class TimeSpan:
         and/or the month, in order to be able to express time spans in a
         human-readable format.
         """
-        fmt = '%d'
-        if month is True:
-            fmt += ' %B'
-        if year is True:
-            fmt += ', %Y'
-        return date.strftime(fmt)
+        return _date_to_str(date, month, year)
 
     def is_single_day(self) -> bool:
         """Return true if the period spans a single day.
@@ -386,17 +645,29 @@ class TimeSpan:
 
     def __format(self, separator: str = '--') -> str:
         """General-purpose string formatting for the Timestamp class.
+
+        The begin and end dates are not supposed to change after the object
+        has been created, so the output is cached for each separator.
+        """
+        try:
+            return self._cache[separator]
+        except KeyError:
+            text = self.__format_uncached(separator)
+            self._cache[separator] = text
+            return text
+
+    def __format_uncached(self, separator: str) -> str:
+        """Actual implementation of the __format() method.
         """
         if self.is_single_day():
-            return self.date_to_str(self.begin_date)
-        end = self.date_to_str(self.end_date)
-        if self.begin_date.year != self.end_date.year:
-            begin = self.date_to_str(self.begin_date)
-        elif self.begin_date.month != self.end_date.month:
-            begin = self.date_to_str(self.begin_date, year=False)
-        else:
-            begin = self.date_to_str(self.begin_date, month=False, year=False)
-        return '{}{}{}'.format(begin, separator, end)
+            return _date_to_str(self.begin_date, True, True)
+        end = _date_to_str(self.end_date, True, True)
+        # The month and the year are only included in the begin date if they
+        # differ from those of the end date.
+        same_year = self.begin_date.year == self.end_date.year
+        same_month = same_year and self.begin_date.month == self.end_date.month
+        begin = _date_to_str(self.begin_date, not same_month, not same_year)
+        return f'{begin}{separator}{end}'
 
     def ascii(self) -> str:
         """ASCII formatting.
@@ -420,78 +691,151 @@ class TimeSpan:
 
 
 
+@dataclass(frozen=True, slots=True)
 class Contribution:
 
     """Class describing a conference contribution (i.e., a talk or a poster).
+
+    Parameters
+    ----------
+    title : str
+        The title of the contribution.
+    invited : bool
+        Flag signaling an invited talk.
+    poster : bool
+        Flag signaling a poster.
+    notes : str, optional
+        Optional notes (e.g., "series of invited lectures") that, if present,
+        take precedence over the invited and poster flags in the output.
+
+    Contributions are immutable (and hashable), and the formatted
+    representations are calculated by the cached module-level functions below,
+    so that identical contributions share the very same rendered strings.
     """
 
-    def __init__(self, title: str, invited: bool = False, poster: bool = False,
-                 notes: Optional[str] = None) -> None:
-        """
-        """
-        self.title = title
-        self.invited = invited
-        self.poster = poster
-        self.notes = notes
+    title: str
+    invited: bool = False
+    poster: bool = False
+    notes: Optional[str] = None
 
     def ascii(self) -> str:
         """ASCII formatting.
         """
-        text = '{}'.format(self.title)
-        if self.notes:
-            text += ' ({})'.format(self.notes)
-        elif self.invited:
-            text += ' (invited talk)'
-        elif self.poster:
-            text += ' (poster)'
-        return text
+        return _contribution_ascii(self)
 
     def html(self) -> str:
         """HTML formatting.
         """
-        text = '<em>"{}"</em>'.format(self.title)
-        if self.notes:
-            text += ' (<b>{}</b>)'.format(self.notes)
-        elif self.invited:
-            text += ' (<b>invited talk</b>)'
-        elif self.poster:
-            text += ' (poster)'
-        return text
+        return _contribution_html(self)
 
     def latex(self) -> str:
         """LaTeX formatting.
         """
-        text = '"\\emph{{{}}}"'.format(self.title)
-        if self.notes:
-            text += ' ({{\\bfseries {}}})'.format(self.notes)
-        elif self.invited:
-            text += ' ({\\bfseries invited talk})'
-        elif self.poster:
-            text += ' (poster)'
-        return text
+        return _contribution_latex(self)
 
     def __str__(self) -> str:
         """String formatting.
         """
-        return self.ascii()
+        return _contribution_ascii(self)
+
+
+# Suffixes for the formatted contributions in the absence of notes, indexed by
+# invited + 2 * poster (mind invited takes precedence over poster, and that the
+# flags are cast to bool, so that any truthy or falsy value works).
+#
+_ASCII_SUFFIXES = ('', ' (invited talk)', ' (poster)', ' (invited talk)')
+_HTML_SUFFIXES = ('', ' (<b>invited talk</b>)', ' (poster)', ' (<b>invited talk</b>)')
+_LATEX_SUFFIXES = ('', ' ({\\bfseries invited talk})', ' (poster)', ' ({\\bfseries invited talk})')
+
+
+@functools.lru_cache(maxsize=None)
+def _contribution_ascii(contribution: Contribution) -> str:
+    """Build the ASCII representation of a contribution.
+    """
+    if contribution.notes:
+        suffix = f' ({contribution.notes})'
+    else:
+        suffix = _ASCII_SUFFIXES[bool(contribution.invited) + 2 * bool(contribution.poster)]
+    return f'{contribution.title}{suffix}'
 
 
+@functools.lru_cache(maxsize=None)
+def _contribution_html(contribution: Contribution) -> str:
+    """Build the HTML representation of a contribution.
+    """
+    if contribution.notes:
+        suffix = f' (<b>{contribution.notes.translate(_HTML_ESCAPE)}</b>)'
+    else:
+        suffix = _HTML_SUFFIXES[bool(contribution.invited) + 2 * bool(contribution.poster)]
+    return f'<em>"{contribution.title.translate(_HTML_ESCAPE)}"</em>{suffix}'
+
+
+@functools.lru_cache(maxsize=None)
+def _contribution_latex(contribution: Contribution) -> str:
+    """Build the LaTeX representation of a contribution.
+    """
+    if contribution.notes:
+        suffix = f' ({{\\bfseries {contribution.notes.translate(_LATEX_ESCAPE)}}})'
+    else:
+        suffix = _LATEX_SUFFIXES[bool(contribution.invited) + 2 * bool(contribution.poster)]
+    return f'"\\emph{{{contribution.title.translate(_LATEX_ESCAPE)}}}"{suffix}'
 
-class Conference:
+
+
+@dataclass(eq=False, slots=True)
+class Conference:  # pylint: disable=too-many-instance-attributes
 
     """Class describing a conference.
+
+    Parameters
+    ----------
+    name : str
+        The conference name.
+    location : str
+        The conference location.
+    webpage : str, optional
+        The url of the conference webpage.
+    begin : str
+        The begin date of the conference in the 'YYYY-MM-DD' format.
+    end : str, optional
+        The end date of the conference in the 'YYYY-MM-DD' format.
+
+    The conference header (i.e., name, location and time span) is formatted
+    once and forever at creation time, while the contributions (that can be
+    added after the fact) are rendered on demand.
     """
 
-    # pylint: disable=too-many-arguments
-    def __init__(self, name: str, location: str, webpage: str,
-                 begin: str, end: Optional[str] = None) -> None:
-        """Constructor.
+    name: str
+    location: str
+    webpage: Optional[str]
+    begin: InitVar[str]
+    end: InitVar[Optional[str]] = None
+    time_span: TimeSpan = field(init=False)
+    contributions: List[Contribution] = field(init=False, default_factory=list)
+    _str: str = field(init=False, repr=False)
+    _html: str = field(init=False, repr=False)
+    _latex: str = field(init=False, repr=False)
+    _year: int = field(init=False, repr=False)
+
+    def __post_init__(self, begin: str, end: Optional[str]) -> None:
+        """Post-initialization hook.
         """
-        self.name = name
-        self.location = location
-        self.webpage = webpage
         self.time_span = TimeSpan(begin, end)
-        self.contributions: List[Contribution] = []
+        self._year = self.time_span.begin_date.year
+        # All the representations share the same structure: the name (linked to
+        # the webpage, where possible) followed by the location and the time
+        # span, each in the appropriate format.
+        # (Mind the name and the location are escaped for html and LaTeX.)
+        html_name = self.name.translate(_HTML_ESCAPE)
+        latex_name = self.name.translate(_LATEX_ESCAPE)
+        if self.webpage is not None:
+            html_name = _html_link(self.webpage, html_name)
+            latex_name = _latex_href(self.webpage, latex_name)
+        html_location = self.location.translate(_HTML_ESCAPE)
+        latex_location = self.location.translate(_LATEX_ESCAPE)
+        self._str = f'{self.name}, {self.location}, {self.time_span.ascii()}'
+        self._html = f'{html_name}, {html_location}, {self.time_span.html()}'
+        self._latex = f'{latex_name}, {latex_location}, {self.time_span.latex()}'
 
     def add_contribution(self, title: str, invited: bool = False,
                          poster: bool = False, notes: Optional[str] = None):
@@ -507,15 +851,12 @@ class Conference:
     def year(self) -> int:
         """Return thr year of the conference.
         """
-        return self.time_span.begin_date.year
+        return self._year
 
     def ascii(self) -> str:
         """ASCII formatting.
         """
-        text = '{}, {}, {}'.format(self.name, self.location, self.time_span)
-        for contribution in self.contributions:
-            text = '{}\n- {}'.format(text, contribution)
-        return text
+        return '\n'.join([self._str, *[f'- {contribution}' for contribution in self.contributions]])
 
     def html(self, indent: int = 0) -> str:
         """HTML formatting.
@@ -525,15 +866,9 @@ class Conference:
         contributions lined up properly. Not the most elegant thing in the
         world, admittedly.
         """
-        if self.webpage is not None:
-            text = '<a href="{}">{}</a>'.format(self.webpage, self.name)
-        else:
-            text = self.name
-        text = '{}, {}, {}'.format(text, self.location, self.time_span.html())
-        for contribution in self.contributions:
-            contr = HTML.indent(contribution.html(), indent + 1)
-            text = '{}{}\n{}'.format(text, HTML.break_(), contr)
-        return text
+        separator = f'{HTML.BR}\n'
+        parts = [HTML.indent(contr.html(), indent + 1) for contr in self.contributions]
+        return separator.join([self._html, *parts])
 
     def latex(self) -> str:
         """LaTeX formatting.
@@ -542,12 +877,7 @@ class Conference:
         -------
         Need to add the loop over the contributions.
         """
-        if self.webpage is not None:
-            text = '\\href{{{}}}{{{}}}'.format(self.webpage, self.name)
-        else:
-            text = self.name
-        text += ', {}, {}'.format(self.location, self.time_span.latex())
-        return text
+        return self._latex
 
     def __str__(self) -> str:
         """String formatting.
@@ -556,32 +886,61 @@ class Conference:
 
 
 
-class ConferenceList(list):
+class ConferenceList:
 
     """Class describing a list of conferences.
+
+    Mind that, unlike the page menu, the html output is not cached here, as the
+    underlying conferences can be modified after the fact by adding
+    contributions.
     """
 
+    __slots__ = ('_entries', )
+
+    def __init__(self) -> None:
+        """Constructor.
+        """
+        self._entries: List[Conference] = []
+
+    def __iter__(self):
+        """Iterate over the conferences.
+        """
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        """Return the number of conferences.
+        """
+        return len(self._entries)
+
+    def __getitem__(self, index):
+        """Return the conference(s) at a given index (or slice).
+        """
+        return self._entries[index]
+
     # pylint: disable=too-many-arguments
     def add_conference(self, name: str, location: str, webpage,
                        begin: str, end: Optional[str] = None) -> Conference:
         """Add a conference to the conference list.
         """
         conference = Conference(name, location, webpage, begin, end)
-        self.append(conference)
+        self._entries.append(conference)
         return conference
 
     def html(self, indent: int = 4) -> str:
         """HTML formatting.
         """
-        lines = [HTML.tag_open('ul', indent, class_='conference-list')]
-        current_year = None
-        for i, conference in enumerate(self):
-            if conference.year() != current_year:
-                class_ = 'conference-year'
-                lines.append(HTML.list_item(conference.year(), indent + 1, class_))
-                current_year = conference.year()
-            class_ = 'conference-item'
-            text = '[{}] {}'.format(i + 1, conference.html(indent + 1))
-            lines.append(HTML.list_item(text, indent + 1, class_))
-        lines.append(HTML.tag_close('ul', indent))
-        return '\n'.join(lines)
+        buffer = io.StringIO()
+        buffer.write(HTML.tag_open('ul', indent, class_='conference-list'))
+        # Flatten the list into (year, index, html) tuples, and group them by
+        # year, so that we get a year header each time the year changes.
+        items = [(conference.year(), i, conference.html(indent + 1))
+                 for i, conference in enumerate(self._entries, 1)]
+        # The list items are formatted in place, each with a single f-string.
+        prefix = HTML.indent_string(indent + 1)
+        for year, group in itertools.groupby(items, key=operator.itemgetter(0)):
+            buffer.write(f'\n{prefix}<li class="conference-year">{year}</li>')
+            for _, i, text in group:
+                buffer.write(f'\n{prefix}<li class="conference-item">[{i}] {text}</li>')
+        buffer.write('\n')
+        buffer.write(HTML.tag_close('ul', indent))
+        return buffer.getvalue()
@@ -20,12 +20,24 @@
 """
 
 
+import argparse
 import logging
 
-from webpage.website import deploy
 from webpage.helpers import ArgumentParser
 
 
+def _positive_int(value: str) -> int:
+    """Argument type for strictly positive integers (e.g., the number of jobs).
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f'invalid positive int value: {value!r}')
+    return number
+
+
 def main() -> None:
     """Deploy the webpage.
 
@@ -35,9 +47,20 @@ def main() -> None:
     """
     parser = ArgumentParser()
     parser.add_argument('--upload', action='store_true')
+    parser.add_argument('-j', '--jobs', type=_positive_int, default=1,
+                        help='maximum number of concurrent jobs for writing and copying files')
+    parser.add_argument('--force', action='store_true',
+                        help='rebuild all the output files, including those that are up to date')
+    parser.add_argument('--loglevel', default='INFO',
+                        choices=('DEBUG', 'INFO', 'WARNING', 'ERROR'),
+                        help='logging level (e.g., WARNING silences the per-file messages)')
     args = parser.parse_args()
-    logging.basicConfig(level=logging.INFO)
-    deploy(args.upload)
+    logging.basicConfig(level=args.loglevel)
+    # Mind the website module (and, with it, the whole page-generation
+    # machinery) is only imported when we actually need it---not, e.g.,
+    # when the script is invoked with --help.
+    from webpage.website import deploy  # pylint: disable=import-outside-toplevel
+    deploy(args.upload, args.jobs, args.force)
 
 
 
@@ -21,10 +21,14 @@
 import logging
 import os
 import shutil
-import functools
 import argparse
+import functools
+import json
 import subprocess
 
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
 
 def cmd(*args: str) -> int:
     """Execute a command (small wrapper around subprocess.run()).
@@ -42,7 +46,7 @@ def cmdoutput(*args: str, strip_endline: bool = True) -> str:
     See https://stackoverflow.com/questions/4760215/ and
     https://stackoverflow.com/questions/606191
     """
-    output = subprocess.run(args, stdout=subprocess.PIPE).stdout.decode('utf-8')
+    output = subprocess.run(args, stdout=subprocess.PIPE, encoding='utf-8').stdout
     if strip_endline:
         output = output.strip('\n')
     return output
@@ -50,36 +54,149 @@ def cmdoutput(*args: str, strip_endline: bool = True) -> str:
 
 def mktree(folder_path: str) -> None:
     """Create a directory tree, if it does not exist already.
+
+    Mind we just try and create the folder (handling the case where it exists
+    already), rather than checking beforehand, which saves a stat() call and
+    is immune to the folder being created in the meantime.
+    """
+    try:
+        os.makedirs(folder_path)
+        logging.info('Created folder %s.', folder_path)
+    except FileExistsError:
+        pass
+
+
+def mtime_cache(function: Callable[[str], Any]) -> Callable[[str], Any]:
+    """Decorator caching the output of a function of a single file path.
+
+    The modification time of the file is part of the cache key, so that the
+    cached output is automatically invalidated when the file changes on disk.
+    (Mind this means a stat() call each time the decorated function is called,
+    which raises FileNotFoundError if the file does not exist.)
+    """
+    @functools.lru_cache(maxsize=1024)
+    def _cached(file_path: str, _mtime: float) -> Any:
+        return function(file_path)
+
+    @functools.wraps(function)
+    def wrapper(file_path: str) -> Any:
+        return _cached(file_path, os.stat(file_path).st_mtime)
+
+    wrapper.cache_clear = _cached.cache_clear
+    return wrapper
+
+
+def up_to_date(target: str, *sources: str) -> bool:
+    """Return True if the target file exists and is not older than any of the
+    sources (in the make sense).
+
+    Mind a missing source file makes the target out of date, so that whatever
+    is responsible for it gets a chance to handle the problem.
     """
-    if not os.path.exists(folder_path):
-        logging.info('Creating folder %s...', folder_path)
-        os.mkdir(folder_path)
+    try:
+        target_mtime = os.stat(target).st_mtime
+        return all(os.stat(src).st_mtime <= target_mtime for src in sources)
+    except FileNotFoundError:
+        return False
 
 
-def copy(src: str, dest: str) -> None:
+def copy(src: str, dest: str, hardlink: bool = False, force: bool = False) -> None:
     """Small utility functions to copy files.
+
+    If hardlink is True, the destination is created as a hard link to the
+    source, which involves no data copy at all, falling back to a regular copy
+    if that is not possible (e.g., across different file systems).
+
+    Unless force is True, the copy is skipped altogether if the destination
+    is up to date with respect to the source.
     """
+    if not force and up_to_date(dest, src):
+        logging.debug('%s is up to date.', dest)
+        return
     logging.info('Copying %s -> %s...', src, dest)
-    shutil.copyfile(src, dest)
+    if hardlink:
+        try:
+            os.link(src, dest)
+            return
+        except FileExistsError:
+            # Replace the stale destination, unless it is already a link to src.
+            if os.path.samefile(src, dest):
+                return
+            os.remove(dest)
+            copy(src, dest, hardlink, True)
+            return
+        except OSError:
+            pass
+    try:
+        shutil.copyfile(src, dest)
+    except shutil.SameFileError:
+        # This happens when dest is a hard link to src from a previous run.
+        pass
+
+
+def copy_files(file_pairs, max_workers: int = 8, hardlink: bool = False,
+               force: bool = False) -> None:
+    """Copy a series of files concurrently.
+
+    The files are passed as an iterable of (src, dest) tuples. Since the actual
+    copy is done in system calls that release the GIL, using a pool of threads
+    allows for overlapping the copies.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(lambda pair: copy(*pair, hardlink, force), file_pairs))
 
 
-def memoize(func):
-    """Simple decorator to memoize the return value of a function.
 
-    See https://stackoverflow.com/questions/5630409
-    for the use of nonlocal in the body of the wrapper function.
+def _stdlib_json_loads(data: bytes) -> Any:
+    """Parse a json document with the standard library.
     """
-    cache = {}
-    @functools.wraps(func)
-    def wrapper(*args, **kwargs):
-        """Simple wrapper for the function call.
+    return json.loads(data)
+
+
+def _stdlib_json_dumps(obj: Any, indent: bool = False, sort_keys: bool = False) -> bytes:
+    """Serialize an object to a (utf-8 encoded) json document with the standard
+    library.
+
+    Mind ensure_ascii=False and the separators are needed for the output to
+    match that of orjson, which always writes non-ASCII characters verbatim,
+    and uses no whitespace in compact mode.
+    """
+    if indent:
+        text = json.dumps(obj, sort_keys=sort_keys, indent=2, separators=(',', ': '),
+                          ensure_ascii=False)
+    else:
+        text = json.dumps(obj, sort_keys=sort_keys, separators=(',', ':'),
+                          ensure_ascii=False)
+    return text.encode('utf-8')
+
+
+# orjson is an optional dependency, with a significantly faster json parser
+# and serializer---we fall back to the standard library if it's not available.
+# (Mind orjson is a C extension that pylint cannot inspect, hence the no-member
+# suppressions below.)
+try:
+    import orjson
+
+    def json_loads(data: bytes) -> Any:
+        """Parse a json document.
         """
-        nonlocal cache
-        if not args in cache:
-            cache[args] = func(*args, **kwargs)
-        return cache[args]
-    return wrapper
+        # pylint: disable=no-member
+        return orjson.loads(data)
 
+    def json_dumps(obj: Any, indent: bool = False, sort_keys: bool = False) -> bytes:
+        """Serialize an object to a (utf-8 encoded) json document.
+        """
+        # pylint: disable=no-member
+        option = 0
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, option=option)
+
+except ImportError:
+    json_loads = _stdlib_json_loads
+    json_dumps = _stdlib_json_dumps
 
 
 class ArgumentFormatter(argparse.RawDescriptionHelpFormatter,
@@ -20,16 +20,27 @@
 
 import logging
 import os
-import json
 import datetime
 
-from typing import Optional, List, Any
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, Any
 
 from loguru import logger
 import requests
+from requests.adapters import HTTPAdapter
 
 from webpage import ORCID_FOLDER
 from webpage.core import HTML, LaTeX
+from webpage.helpers import json_dumps, json_loads, mtime_cache
+
+@mtime_cache
+def _read_json(file_path: str) -> dict:
+    """Read data from a local json file.
+    """
+    logging.debug('Reading data from %s...', file_path)
+    with open(file_path, 'rb') as input_file:
+        return json_loads(input_file.read())
+
 
 
 class Work(dict):
@@ -203,11 +214,11 @@ class Work(dict):
         """
         data = self._navigate('citation')
         if data is None:
-            logger.warning(f'No citation data available for {self.info}')
+            logger.warning('No citation data available for {}', self.info)
             return
         citation_type = data.get('citation-type')
         if citation_type is None:
-            logger.warning(f'No citation-type available for {self.info}' )
+            logger.warning('No citation-type available for {}', self.info)
             return
         if citation_type.lower() == 'bibtex':
             bibtex = data['citation-value']
@@ -220,9 +231,9 @@ class Work(dict):
                             proceedings = True
                             break
                 if not proceedings:
-                    logger.warning(f'No volume information available for {self.info}')
+                    logger.warning('No volume information available for {}', self.info)
             return data
-        logger.warning(f'Unknown citation type ({citation_type}) for {self.info}')
+        logger.warning('Unknown citation type ({}) for {}', citation_type, self.info)
 
     @staticmethod
     def _citation_string(data, dash='-'):
@@ -299,11 +310,13 @@ class Work(dict):
 
 
 
-class WorkList(List[Work]):
+class WorkList(list):
 
     """Class representing a list of ORCID works.
 
-    And, in human language, this is really a publication list.
+    And, in human language, this is really a publication list. (The elements
+    are Work objects, but we subclass the plain builtin list, rather than the
+    typing.List[Work] generic alias, which is only really documentation.)
     """
 
     def _format(self, year_formatter, work_formatter):
@@ -314,10 +327,10 @@ class WorkList(List[Work]):
         for i, work in enumerate(self):
             if work.year != current_year:
                 # Drop a special entry for the year in case of change.
-                lines.append('{}'.format(year_formatter(work.year)))
+                lines.append(year_formatter(work.year))
                 current_year = work.year
             # And this is the actual element for the publication.
-            lines.append('[{}] {}'.format(i + 1, work_formatter(work)))
+            lines.append(f'[{i + 1}] {work_formatter(work)}')
         return lines
 
     def ascii(self) -> str:
@@ -348,12 +361,10 @@ class WorkList(List[Work]):
         current_year = None
         for i, work in enumerate(self):
             if work.year != current_year:
-                class_ = 'publication-year'
-                lines.append(HTML.list_item(str(work.year), indent + 1, class_))
+                lines.append(HTML.list_item(str(work.year), indent + 1, 'publication-year'))
                 current_year = work.year
-            class_ = 'publication-item'
-            text = '[{}] {}'.format(i + 1, work.html())
-            lines.append(HTML.list_item(text, indent + 1, class_))
+            text = f'[{i + 1}] {work.html()}'
+            lines.append(HTML.list_item(text, indent + 1, 'publication-item'))
         lines.append(HTML.tag_close('ul', indent))
         return '\n'.join(lines)
 
@@ -429,31 +440,49 @@ class ORCID:
 
     BASE_URL = 'http://pub.orcid.org'
     LOCAL_FOLDER = ORCID_FOLDER
+    MAX_FETCH_WORKERS = 8
 
     def __init__(self, orcid_id: str = '0000-0002-9785-7726', force_fetch: bool = False) -> None:
         """Constructor.
 
         Here we are essentially fetching the ORCID data from either a local
         json file or the ORCID server.
+
+        All the requests go through a single session, so that the underlying
+        connections to the server are kept alive and reused, and the works
+        that are not cached locally are fetched concurrently.
         """
         self.orcid_id = orcid_id
-        # Fetch the top-level ORCID data.
-        self.data = self._load(self._url(), self._file_path(), force_fetch)
-        # Loop over the works and fetch all the detailed work information.
-        # Admittedly we could do a cleaner job, here---but it's only done once.
-        self.work_list = WorkList()
-        logging.info('Populating work list...')
-        for work in self.data['activities-summary']['works']['group']:
-            summary = self.work_summary(work)
-            path = summary['path']
-            put_code = summary['put-code']
-            url = self._url(path)
-            file_name = '{}-work-{}.json'.format(self.orcid_id, put_code)
-            file_path = self._file_path(file_name)
+        # Common prefix for the paths to the local files for the single works.
+        self._work_prefix = self._file_path(f'{self.orcid_id}-work-')
+        # Mind the session is only kept open while populating the work list.
+        with requests.Session() as session:
+            adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            # Fetch the top-level ORCID data.
+            self.data = self._load(self._url(), self._file_path(), force_fetch, session)
+            # Loop over the works and fetch all the detailed work information.
             # Mind we're never forcing re-fetching individual works from the
-            # server, as they typically not changing.
-            work = Work(self._load(url, file_path, force_fetch=False))
-            self.work_list.append(work)
+            # server, as they typically not changing: the works that are cached
+            # are read inline, and the others are fetched in a thread pool.
+            logging.info('Populating work list...')
+            work_data = []
+            with ThreadPoolExecutor(max_workers=self.MAX_FETCH_WORKERS) as executor:
+                for work in self.data['activities-summary']['works']['group']:
+                    summary = self.work_summary(work)
+                    file_path = f'{self._work_prefix}{summary["put-code"]}.json'
+                    if os.path.exists(file_path):
+                        work_data.append(self._read(file_path))
+                    else:
+                        url = self._url(summary['path'])
+                        work_data.append(executor.submit(self._fetch, url, file_path, session))
+        # Collect the results, preserving the original order.
+        self.work_list = WorkList()
+        for data in work_data:
+            if isinstance(data, Future):
+                data = data.result()
+            self.work_list.append(Work(data))
         logging.info('Sorting work list...')
         self.work_list.sort(reverse=True)
 
@@ -464,43 +493,54 @@ class ORCID:
         url and have a leading /, so this method is consistent with that.
         """
         if path is None:
-            path = '/{}'.format(self.orcid_id)
-        return '{}{}'.format(self.BASE_URL, path)
+            path = f'/{self.orcid_id}'
+        return f'{self.BASE_URL}{path}'
 
     def _file_path(self, file_name: Optional[str] = None) -> str:
         """Return the full absolute path to the file with a given name in the
         local folder (can be used in either read or write mode).
+
+        Since file_name is a plain file name, we can get away with a string
+        concatenation, rather than an os.path.join() call.
         """
         if file_name is None:
-            file_name = '{}.json'.format(self.orcid_id)
-        return os.path.join(self.LOCAL_FOLDER, file_name)
+            file_name = f'{self.orcid_id}.json'
+        return f'{self.LOCAL_FOLDER}{os.sep}{file_name}'
 
     @staticmethod
-    def _fetch(url: str, output_file_path: str) -> dict:
+    def _fetch(url: str, output_file_path: str,
+               session: Optional[requests.Session] = None) -> dict:
         """Generic fetch function to send a request to the server and save
         the response to a json file.
 
+        If a session is passed, the request is sent through it, reusing the
+        underlying (pooled) connections.
+
         Return the data fetched from the server.
         """
         logging.info('Fetching data from %s...', url)
-        resp = requests.get(url, headers={'Accept':'application/orcid+json'})
-        with open(output_file_path, 'w') as output_file:
+        if session is None:
+            session = requests
+        resp = session.get(url, headers={'Accept':'application/orcid+json'})
+        data = json_loads(resp.content)
+        with open(output_file_path, 'wb') as output_file:
             logging.info('Writing data to %s...', output_file_path)
-            data = resp.json()
-            json.dump(data, output_file)
+            output_file.write(json_dumps(data))
         return data
 
     @staticmethod
     def _read(input_file_path: str) -> dict:
-        """Read data from a local jsone file.
+        """Read data from a local json file.
+
+        The parsed data are cached process-wide, so that repeated
+        instantiations of the class only parse files that changed on disk.
+        (Mind the cached dicts are shared, and should not be modified in place.)
         """
-        logging.debug('Reading data from %s...', input_file_path)
-        with open(input_file_path) as input_file:
-            data = json.load(input_file)
-        return data
+        return _read_json(input_file_path)
 
     @classmethod
-    def _load(cls, url: str, file_path: str, force_fetch: bool = False) -> dict:
+    def _load(cls, url: str, file_path: str, force_fetch: bool = False,
+              session: Optional[requests.Session] = None) -> dict:
         """Load some ORCID data from either a local json file (if it exists
         and the force_fetch flag is set to False), or fetching directly from
         the server.
@@ -510,13 +550,13 @@ class ORCID:
         """
         if os.path.exists(file_path) and not force_fetch:
             return cls._read(file_path)
-        return cls._fetch(url, file_path)
+        return cls._fetch(url, file_path, session)
 
     @staticmethod
     def dump(json_item: dict, sort_keys: bool = False) -> str:
         """Formatting function for json elements.
         """
-        return json.dumps(json_item, sort_keys=sort_keys, indent=2, separators=(',', ': '))
+        return json_dumps(json_item, True, sort_keys).decode('utf-8')
 
     @staticmethod
     def work_summary(work: dict) -> dict:
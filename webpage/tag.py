@@ -48,7 +48,7 @@ def bump_version(mode: str) -> str:
         patch = 0
     elif mode == 'patch':
         patch += 1
-    new_version = '{}.{}.{}'.format(major, minor, patch)
+    new_version = f'{major}.{minor}.{patch}'
     logging.info('New version is %s', new_version)
     return new_version
 
@@ -58,14 +58,14 @@ def update_version_file(version: str, timestamp: str, revision: str) -> None:
     """
     file_path = os.path.join(WEBPAGE_FOLDER, 'version.py')
     logging.info('Writing version file "%s"...', file_path)
-    text = """\
-    # Automatically created by {}, do not edit by hand.
+    text = f"""\
+    # Automatically created by {__file__}, do not edit by hand.
     # pylint: skip-file
     #
-    version = "{}"
-    release_date = "{}"
-    revision = "{}"
-    """.format(__file__, version, timestamp, revision)
+    version = "{version}"
+    release_date = "{timestamp}"
+    revision = "{revision}"
+    """
     text = textwrap.dedent(text)
     with open(file_path, 'w') as input_file:
         input_file.write(text)
@@ -89,8 +89,7 @@ def update_release_notes(version: str, timestamp: str, revision: str) -> None:
         assert line == '=============\n'
         lines.append(line)
         # Append the release-manager-generated line.
-        line = '\n\n*webpage {} ({}) - {}*\n\n'.format(version, revision,
-                                                       timestamp)
+        line = f'\n\n*webpage {version} ({revision}) - {timestamp}*\n\n'
         lines.append(line)
         # Skip any leading empty line.
         line = ' '
@@ -118,11 +117,11 @@ def tag(version: str) -> None:
     revision = cmdoutput('git', 'rev-parse', 'HEAD')
     update_version_file(version, timestamp, revision)
     update_release_notes(version, timestamp, revision)
-    msg = 'Prepare for tag %s.' % version
-    cmd('git', 'commit', '-a', '-m "{}"'.format(msg))
+    msg = f'Prepare for tag {version}.'
+    cmd('git', 'commit', '-a', f'-m "{msg}"')
     cmd('git', 'push')
-    msg = 'Tagging version {}'.format(version)
-    cmd('git', 'tag', '-a', '{}'.format(version), '-m "{}"'.format(msg))
+    msg = f'Tagging version {version}'
+    cmd('git', 'tag', '-a', version, f'-m "{msg}"')
     cmd('git', 'push', '--tags')
 
 
@@ -213,7 +213,7 @@ CONFERENCE_LIST.add_conference(
     'The Fermi Large Area Telescope', invited=True
 )
 CONFERENCE_LIST.add_conference(
-    'Fisica 2010&ndash;2020: Congresso di Dipartimento',
+    'Fisica 2010–2020: Congresso di Dipartimento',
     'Pisa (Italy)',
     'http://www.df.unipi.it/content/generic/%5Byy%5D%5Bmm%5D%5Bdd%5D/congressino-2013',
     '2013-04-17'
@@ -291,7 +291,7 @@ CONFERENCE_LIST.add_conference(
 )
 CONFERENCE_LIST.add_conference(
     '23rd Rencontres de Blois',
-    'Ch&acirc;teau Royal de Blois (France)',
+    'Château Royal de Blois (France)',
     'http://confs.obspm.fr/Blois2011/',
     '2011-05-29', '2011-06-03'
 ).add_contribution(
@@ -313,7 +313,7 @@ CONFERENCE_LIST.add_conference(
     'The Fermi LAT Calorimeter as a gamma-ray telescope', poster=True
 )
 CONFERENCE_LIST.add_conference(
-    'Les Rencontres de Physique de la Vall&eacute;e d\'Aoste',
+    'Les Rencontres de Physique de la Vallée d\'Aoste',
     'La Thuile (Italy)',
     'http://www.pi.infn.it/lathuile/lathuile_2011.html',
     '2011-02-27', '2011-03-05'
@@ -19,24 +19,23 @@
 """
 
 import datetime
+import functools
 import os
-import glob
 import logging
+import string
 import subprocess
 
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
 
 import webpage
 from webpage.core import PageMenu, HTML
-from webpage.helpers import copy, memoize
-from webpage.orcid import ORCID
-from webpage.talks import CONFERENCE_LIST
+from webpage.helpers import copy_files, up_to_date
 
 
 # Basic configuration.
 #
 PAGE_AUTHOR = 'Luca Baldini'
-PAGE_DESCRIPTION = '%s\'s home page' % PAGE_AUTHOR
+PAGE_DESCRIPTION = f'{PAGE_AUTHOR}\'s home page'
 PAGE_BASE_TITLE = 'Luca Baldini @ UNIPI/INFN'
 PAGE_HEADER_TEXT = PAGE_BASE_TITLE
 PAGE_KEYWORDS = ('Luca Baldini',
@@ -50,17 +49,38 @@ PAGE_KEYWORDS = ('Luca Baldini',
                  'IXPE')
 PAGE_KEYWORDS_STRING = ', '.join(PAGE_KEYWORDS)
 DATETIME_FORMAT = '%A, %B %d %Y at %H:%M'
-LAST_UPDATE = datetime.datetime.now()
-LAST_UPDATE_STRING = LAST_UPDATE.strftime(DATETIME_FORMAT)
 COPYRIGHT_START_YEAR = 2012
-COPYRIGHT_END_YEAR = LAST_UPDATE.year
 STYLE_SHEETS = ['default.css']
 DEFAULT_STYLE_SHEET = STYLE_SHEETS[0]
-DEFAULT_CSS_HREF = '%s/%s' % (webpage.CSS_FOLDER_NAME, DEFAULT_STYLE_SHEET)
+DEFAULT_CSS_HREF = f'{webpage.CSS_FOLDER_NAME}/{DEFAULT_STYLE_SHEET}'
 REMOTE_URLS = ['lbaldini@galilinux.pi.infn.it:public_html',
                'a012425@osiris.df.unipi.it:public_html']
 
 
+@functools.lru_cache(maxsize=None)
+def template_fields() -> dict:
+    """Return the static fields of the page template, i.e., everything that is
+    not depending on the language, the specific page or the menu.
+
+    Mind this includes the last update, which is therefore the time of the
+    first call (this is cached, and the fields are calculated once and for
+    all), rather than that of the module import.
+    """
+    last_update = datetime.datetime.now()
+    return {
+        'base_title': PAGE_BASE_TITLE,
+        'keywords': PAGE_KEYWORDS_STRING,
+        'description': PAGE_DESCRIPTION,
+        'author': PAGE_AUTHOR,
+        'css_target': DEFAULT_CSS_HREF,
+        'header': PAGE_HEADER_TEXT,
+        'copyright_start': COPYRIGHT_START_YEAR,
+        'copyright_end': last_update.year,
+        'last_update': last_update.strftime(DATETIME_FORMAT),
+        'version': webpage.__version__
+    }
+
+
 # Hooks for the main menu.
 #
 def pubs_hook() -> str:
@@ -69,13 +89,19 @@ def pubs_hook() -> str:
     Note if this was not wrapped in a function we would instantiate an
     ORCID() object when importing the module, which in turn implies we
     would be loading all the data before we actually use them (and log
-    all the related messages.)
+    all the related messages.) For the same reason, the orcid module itself
+    (which pulls in the requests package) is only imported here.
     """
+    from webpage.orcid import ORCID  # pylint: disable=import-outside-toplevel
     return ORCID().work_list.html()
 
 def talks_hook() -> str:
     """Hook for the "Presentation" menu entry.
+
+    As for the publications, the (fairly long) list of conferences is only
+    built when the corresponding page is rendered.
     """
+    from webpage.talks import CONFERENCE_LIST  # pylint: disable=import-outside-toplevel
     return CONFERENCE_LIST.html()
 
 
@@ -94,8 +120,49 @@ MENU.add_entry('Miscellanea', 'misc.html', 'fas fa-random')
 MENU.add_entry('Didattica', 'teaching.html', 'fas fa-chalkboard-teacher', language='it')
 
 
-@memoize
-def page_template(language: str = 'en') -> str:
+# Buffer size for writing the output pages (large enough for the typical
+# page to be written to disk in a single system call).
+_WRITE_BUFFER_SIZE = 1 << 16
+
+# Page-specific fields of the page template, i.e., those that are filled in
+# separately for each page.
+PAGE_FIELDS = ('title', 'menu', 'content')
+
+
+def parse_template(text: str, fields: dict) -> tuple:
+    """Parse a page template in a single pass.
+
+    All the static fields are replaced with the corresponding values in the
+    fields dictionary (honoring any conversion and format specification, in
+    the str.format() sense), and the template is returned as a tuple of
+    (literal, field) pairs, where the literal text is followed by the name of
+    the page-specific field (one of PAGE_FIELDS) that comes next---or None for
+    the very last chunk.
+
+    Mind the page-specific fields are streamed verbatim to the output, and
+    therefore cannot have a conversion or a format specification.
+    """
+    formatter = string.Formatter()
+    parts = []
+    literal = ''
+    for chunk, field_name, format_spec, conversion in formatter.parse(text):
+        literal += chunk
+        if field_name is None:
+            continue
+        if field_name in PAGE_FIELDS:
+            if format_spec or conversion:
+                raise ValueError(f'Page field {field_name!r} cannot be formatted.')
+            parts.append((literal, field_name))
+            literal = ''
+        else:
+            value = formatter.convert_field(fields[field_name], conversion)
+            literal += format(value, format_spec)
+    parts.append((literal, None))
+    return tuple(parts)
+
+
+@functools.lru_cache(maxsize=None)
+def page_template(language: str = 'en') -> tuple:
     """Create the basic template for all the HTML pages in the website.
 
     The function is reading the basic template in the html file in the contents
@@ -103,83 +170,123 @@ def page_template(language: str = 'en') -> str:
     once and forever at the beginning, such as the last update. The template can
     then be interpolated to add the menu and the actual content.
 
-    Note this is wrapped with the @memoize decorator, so that we do not read
-    the html template more times than necessary (i.e., exactly once per line).
+    The template is parsed by parse_template(), and returned as a tuple of
+    (literal, field) pairs.
+
+    Note this is wrapped with the @functools.lru_cache decorator, so that we do
+    not read the html template more times than necessary (i.e., exactly once
+    per language).
     """
     text = webpage.read_content('template.html')
-    text = text.format(language=language, base_title=PAGE_BASE_TITLE,
-                       keywords=PAGE_KEYWORDS_STRING,
-                       description=PAGE_DESCRIPTION, author=PAGE_AUTHOR,
-                       css_target=DEFAULT_CSS_HREF, header=PAGE_HEADER_TEXT,
-                       copyright_start=COPYRIGHT_START_YEAR,
-                       copyright_end=COPYRIGHT_END_YEAR,
-                       last_update=LAST_UPDATE_STRING,
-                       version=webpage.__version__)
-    return text
+    return parse_template(text, {**template_fields(), 'language': language})
+
+
+@functools.lru_cache(maxsize=None)
+def _page_dependencies() -> tuple:
+    """Return the paths to the files that all the pages depend upon (beside
+    their own content file), i.e., the template and the python modules
+    defining the menu and the rendering.
+    """
+    return (webpage.content_file_path('template.html'), __file__,
+            os.path.join(webpage.WEBPAGE_FOLDER, 'core.py'),
+            os.path.join(webpage.WEBPAGE_FOLDER, 'version.py'))
 
 
 def _write_page(title: str, target: str, hook=None,
-                language: str = 'en') -> None:
+                language: str = 'en', force: bool = True) -> None:
     """Write a single html page to file.
 
     This is the main workhorse function to wirte static html web pages.
+
+    Note the page is never assembled in memory: the static parts of the
+    template and the page-specific pieces are streamed, in order, to the
+    output file.
+
+    Unless force is True, the page is skipped altogether if the output file
+    is up to date with respect to its content file and all the common
+    dependencies (in the make sense). Mind pages with a hook are always
+    written, since we have no way to track what the hook depends upon.
     """
+    output_file_path = webpage.output_file_path(target)
+    if not force and hook is None and \
+       up_to_date(output_file_path, webpage.content_file_path(target), *_page_dependencies()):
+        logging.info('Page "%s" is up to date.', title)
+        return
     logging.info('Processing page "%s"...', title)
-    template = page_template(language)
-    menu = HTML.indent(MENU.html(title), 4)
-    content = HTML.indent(webpage.read_content(target), 4)
+    content = [HTML.indent(webpage.read_content(target), 4)]
     if hook is not None:
-        content = '{}\n{}'.format(content, hook())
-    text = template.format(title, menu, title, content)
-    output_file_path = webpage.output_file_path(target)
+        content += ['\n', hook()]
+    values = {'title': (title, ), 'menu': (MENU.html(title, 4), ), 'content': content}
     logging.info('Writing output file to %s...', output_file_path)
-    with open(output_file_path, 'w') as output_file:
-        output_file.write(text)
+    with open(output_file_path, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as output_file:
+        for literal, field_name in page_template(language):
+            output_file.write(literal)
+            if field_name is not None:
+                output_file.writelines(values[field_name])
     logging.info('Done.')
 
 
-def write_static_pages() -> None:
+def write_static_pages(jobs: int = 1, force: bool = True) -> None:
     """Write all the html pages in the menu to file.
+
+    The pages are independent from each other and are written by a pool of
+    (at most) jobs threads. Unless force is True, the pages that are up to
+    date are not written again.
     """
-    # Write the static pages driven by the menu.
-    for entry in MENU:
-        if entry.points_to_file():
-            _write_page(entry.title, entry.target, entry.hook, entry.language)
-    # And write everything else is necessary.
-    _write_page('About this website', 'about.html')
+    # The static pages driven by the menu...
+    pages = [(entry.title, entry.target, entry.hook, entry.language, force)
+             for entry in MENU if entry.points_to_file()]
+    # ... and everything else is necessary.
+    pages.append(('About this website', 'about.html', None, 'en', force))
+    # Mind the template fields (including the last update) are evaluated here,
+    # once and for all, rather than by the first worker threads that get there,
+    # so that all the pages are guaranteed to share the same timestamp.
+    template_fields()
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        list(executor.map(lambda args: _write_page(*args), pages))
 
 
-def copy_style_sheets() -> None:
+def copy_style_sheets(jobs: int = 1, hardlink: bool = True, force: bool = True) -> None:
     """Copy the relevant style sheets from the local source folder to the
     output html folder to be copied on the remote server.
+
+    By default the files are hard-linked, rather than copied, whenever
+    possible (the output files are never modified in place), and, unless
+    force is True, the files that are up to date are not copied again. This
+    applies to all the copy functions in this module.
     """
     logging.info('Copying style sheets...')
-    for css in STYLE_SHEETS:
-        src = os.path.join(webpage.CSS_FOLDER, css)
-        dest = os.path.join(webpage.OUTPUT_CSS_FOLDER, css)
-        copy(src, dest)
+    file_pairs = [(os.path.join(webpage.CSS_FOLDER, css),
+                   os.path.join(webpage.OUTPUT_CSS_FOLDER, css)) for css in STYLE_SHEETS]
+    copy_files(file_pairs, jobs, hardlink, force)
 
 
-def copy_images(file_formats=('png', 'jpg')) -> None:
+def copy_images(file_formats=('png', 'jpg', 'jpeg'), jobs: int = 1,
+                hardlink: bool = True, force: bool = True) -> None:
     """Copy all the relevant images into the output folder.
+
+    Note the file extensions are matched in a case-insensitive fashion.
     """
     logging.info('Copying images...')
-    file_list: List[str] = []
-    for fmt in file_formats:
-        file_list = glob.glob(os.path.join(webpage.IMG_FOLDER, '*.%s' % fmt))
-    for src in file_list:
-        dest = os.path.join(webpage.OUTPUT_IMG_FOLDER, os.path.basename(src))
-        copy(src, dest)
+    # Mind we scan the image folder once, rather than globbing it once per
+    # file format.
+    extensions = {f'.{fmt.lower()}' for fmt in file_formats}
+    with os.scandir(webpage.IMG_FOLDER) as entries:
+        file_list = [entry.path for entry in entries
+                     if entry.is_file() and os.path.splitext(entry.name)[1].lower() in extensions]
+    copy_files([(src, os.path.join(webpage.OUTPUT_IMG_FOLDER, os.path.basename(src)))
+                for src in file_list], jobs, hardlink, force)
 
 
-def copy_misc() -> None:
+def copy_misc(jobs: int = 1, hardlink: bool = True, force: bool = True) -> None:
     """Copy all the miscellanea files into the output folder.
     """
     logging.info('Copying miscellanea...')
-    file_list = glob.glob(os.path.join(webpage.MISC_FOLDER, '*'))
-    for src in file_list:
-        dest = os.path.join(webpage.OUTPUT_MISC_FOLDER, os.path.basename(src))
-        copy(src, dest)
+    with os.scandir(webpage.MISC_FOLDER) as entries:
+        file_list = [entry.path for entry in entries
+                     if entry.is_file() and not entry.name.startswith('.')]
+    copy_files([(src, os.path.join(webpage.OUTPUT_MISC_FOLDER, os.path.basename(src)))
+                for src in file_list], jobs, hardlink, force)
 
 
 def upload_files() -> None:
@@ -187,19 +294,27 @@ def upload_files() -> None:
     main remote server and its mirror.
     """
     for url in REMOTE_URLS:
-        cmd = 'scp -r {}/* {}'.format(webpage.OUTPUT_FOLDER, url)
+        cmd = f'scp -r {webpage.OUTPUT_FOLDER}/* {url}'
         logging.info('About to execute "%s"...', cmd)
         subprocess.run(cmd, shell=True)
         logging.info('Done.')
 
 
-def deploy(upload: bool = False):
+def deploy(upload: bool = False, jobs: int = 1, force: bool = False):
     """Deploy the glorious website.
+
+    The jobs argument controls the maximum number of threads used for writing
+    the pages and copying the ancillary files (in the make -j sense).
+
+    By default the build is incremental, i.e., the output files that are up
+    to date with respect to their sources are left alone (mind this includes
+    the last update timestamp in the page footers). Pass force=True to
+    rebuild everything from scratch.
     """
     webpage.create_local_tree()
-    write_static_pages()
-    copy_style_sheets()
-    copy_images()
-    copy_misc()
+    write_static_pages(jobs, force)
+    copy_style_sheets(jobs, force=force)
+    copy_images(jobs=jobs, force=force)
+    copy_misc(jobs, force=force)
     if upload:
         upload_files()